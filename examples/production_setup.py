@@ -13,28 +13,48 @@ import logging
 import sys
 import tempfile
 from pathlib import Path
-from typing import Optional
+from typing import Any, List, Literal, Optional
 
 try:
-    from pydantic import BaseModel, Field, SecretStr, validator
-    VALIDATION_AVAILABLE = True
+    import orjson  # Optional: pip install liteconfig_py[fast]
 except ImportError:
-    print("Warning: Pydantic not available. Install with: pip install liteconfig_py[validation]")
-    VALIDATION_AVAILABLE = False
+    orjson = None
+
+# Imported eagerly so the schemas below are compiled at import (see the note
+# after them) rather than on the first validation
+try:
+    from pydantic import BaseModel, ConfigDict, Field, SecretStr, validator
+    PYDANTIC_AVAILABLE = True
+except ImportError:
+    PYDANTIC_AVAILABLE = False
 
 from liteconfig_py import Config
 
+# Log level names accepted by the logging.level setting
+_LEVELS = {
+    'DEBUG': logging.DEBUG,
+    'INFO': logging.INFO,
+    'WARNING': logging.WARNING,
+    'ERROR': logging.ERROR,
+    'CRITICAL': logging.CRITICAL,
+}
+
+# Allowed values for enumerated settings. Literal fields are checked by set
+# membership in pydantic-core rather than by compiling one regex per field.
+LogLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+SSLMode = Literal["disable", "allow", "prefer", "require", "verify-ca", "verify-full"]
 
 # Define strict production configuration schema
-if VALIDATION_AVAILABLE:
+if PYDANTIC_AVAILABLE:
     class DatabaseConfig(BaseModel):
         """Production database configuration."""
+        model_config = ConfigDict(frozen=True)
         host: str = Field(..., min_length=1)
         port: int = Field(..., ge=1, le=65535)
         name: str = Field(..., min_length=1)
         username: str = Field(..., min_length=1)
         password: SecretStr = Field(..., min_length=8)
-        ssl_mode: str = Field(default="require", pattern="^(disable|allow|prefer|require|verify-ca|verify-full)$")
+        ssl_mode: SSLMode = Field(default="require")
         pool_size: int = Field(default=20, ge=5, le=100)
         pool_timeout: int = Field(default=30, ge=1)
 
@@ -45,9 +65,9 @@ if VALIDATION_AVAILABLE:
                 raise ValueError("Production database must not use localhost")
             return v
 
-
     class RedisConfig(BaseModel):
         """Redis cache configuration."""
+        model_config = ConfigDict(frozen=True)
         host: str
         port: int = Field(default=6379, ge=1, le=65535)
         password: Optional[SecretStr] = None
@@ -55,12 +75,12 @@ if VALIDATION_AVAILABLE:
         ssl: bool = Field(default=True)
         socket_timeout: int = Field(default=5, ge=1)
 
-
     class SecurityConfig(BaseModel):
         """Security settings."""
+        model_config = ConfigDict(frozen=True)
         secret_key: SecretStr = Field(..., min_length=32)
-        allowed_hosts: list[str] = Field(..., min_items=1)
-        cors_origins: list[str] = Field(default_factory=list)
+        allowed_hosts: tuple[str, ...] = Field(..., min_length=1)
+        cors_origins: tuple[str, ...] = Field(default=())
         rate_limit: int = Field(default=100, ge=1)
         session_timeout: int = Field(default=3600, ge=300)
 
@@ -72,27 +92,27 @@ if VALIDATION_AVAILABLE:
                 raise ValueError("Secret key appears to be weak or default")
             return v
 
-
     class LoggingConfig(BaseModel):
         """Logging configuration."""
-        level: str = Field(default="INFO", pattern="^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$")
+        model_config = ConfigDict(frozen=True)
+        level: LogLevel = Field(default="INFO")
         format: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
         file: Optional[str] = None
         max_bytes: int = Field(default=10485760, ge=1024)  # 10MB
         backup_count: int = Field(default=5, ge=1, le=50)
 
-
     class MonitoringConfig(BaseModel):
         """Monitoring and observability."""
+        model_config = ConfigDict(frozen=True)
         enabled: bool = Field(default=True)
         metrics_port: int = Field(default=9090, ge=1024, le=65535)
         health_check_interval: int = Field(default=30, ge=5)
         sentry_dsn: Optional[str] = None
 
-
     class ProductionConfig(BaseModel):
         """Complete production configuration."""
-        environment: str = Field(..., pattern="^(production|prod)$")
+        model_config = ConfigDict(frozen=True)
+        environment: Literal["production", "prod"] = Field(...)
         debug: bool = Field(default=False)
         database: DatabaseConfig
         redis: RedisConfig
@@ -107,14 +127,24 @@ if VALIDATION_AVAILABLE:
                 raise ValueError("Debug mode must be disabled in production")
             return v
 
+    # Pydantic compiles each model's validator as its class body runs, so the
+    # schemas above are compiled when this module is imported and the first
+    # config.validate(ProductionConfig) call only walks the data; a separate
+    # TypeAdapter would only compile a second copy.
+
 
 def setup_logging(config: Config) -> None:
     """Configure application logging."""
-    log_level = config.get('logging.level', 'INFO')
-    log_format = config.get('logging.format')
+    logging_settings = config.get('logging') or {}
+    log_level = logging_settings.get('level', 'INFO')
+    log_format = logging_settings.get('format')
+    try:
+        level = _LEVELS[log_level]
+    except KeyError:
+        raise ValueError(f"Unknown log level: {log_level!r}") from None
 
     logging.basicConfig(
-        level=getattr(logging, log_level),
+        level=level,
         format=log_format,
         handlers=[
             logging.StreamHandler(sys.stdout),
@@ -124,8 +154,9 @@ def setup_logging(config: Config) -> None:
 
 def validate_production_config(config: Config) -> Optional['ProductionConfig']:
     """Validate production configuration with detailed error reporting."""
-    if not VALIDATION_AVAILABLE:
-        logging.warning("Pydantic not available - skipping validation")
+    if not PYDANTIC_AVAILABLE:
+        logging.warning("Pydantic not available - skipping validation. "
+                        "Install with: pip install liteconfig_py[validation]")
         return None
 
     try:
@@ -142,19 +173,23 @@ def check_configuration_health(config: Config) -> bool:
     """Perform basic configuration health checks."""
     checks_passed = True
 
+    # Fetch each section once and read its keys with plain dict access
+    database = config.get('database') or {}
+    security = config.get('security') or {}
+
     # Check database configuration
-    if not config.get('database.host'):
+    if not database.get('host'):
         logging.error("Database host not configured")
         checks_passed = False
 
     # Check security settings
-    secret_key = config.get('security.secret_key', '')
+    secret_key = security.get('secret_key', '')
     if len(secret_key) < 32:
         logging.error("Secret key is too short (minimum 32 characters)")
         checks_passed = False
 
     # Check allowed hosts
-    allowed_hosts = config.get('security.allowed_hosts', [])
+    allowed_hosts = security.get('allowed_hosts', [])
     if not allowed_hosts or '*' in allowed_hosts:
         logging.warning("Allowed hosts is not properly configured")
 
@@ -166,60 +201,61 @@ def check_configuration_health(config: Config) -> bool:
     return checks_passed
 
 
-def create_example_production_config(tmpdir: Path) -> tuple[str, str]:
-    """Create example production configuration files."""
-    # Main configuration file
-    config_data = {
-        "environment": "production",
-        "debug": False,
-        "database": {
-            "host": "db-cluster.prod.internal",
-            "port": 5432,
-            "name": "myapp_production",
-            "username": "app_user",
-            "password": "placeholder",  # Will be overridden by .env
-            "ssl_mode": "require",
-            "pool_size": 20,
-            "pool_timeout": 30
-        },
-        "redis": {
-            "host": "redis.prod.internal",
-            "port": 6379,
-            "password": "placeholder",  # Will be overridden by .env
-            "db": 0,
-            "ssl": True,
-            "socket_timeout": 5
-        },
-        "security": {
-            "secret_key": "placeholder",  # Will be overridden by .env
-            "allowed_hosts": ["app.example.com", "www.example.com"],
-            "cors_origins": ["https://app.example.com"],
-            "rate_limit": 100,
-            "session_timeout": 3600
-        },
-        "logging": {
-            "level": "INFO",
-            "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            "file": "/var/log/myapp/app.log",
-            "max_bytes": 10485760,
-            "backup_count": 5
-        },
-        "monitoring": {
-            "enabled": True,
-            "metrics_port": 9090,
-            "health_check_interval": 30,
-            "sentry_dsn": None
-        }
+def _encode_json(data: Any) -> bytes:
+    """Encode data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+# Example production configuration, serialized once at import
+PRODUCTION_CONFIG = {
+    "environment": "production",
+    "debug": False,
+    "database": {
+        "host": "db-cluster.prod.internal",
+        "port": 5432,
+        "name": "myapp_production",
+        "username": "app_user",
+        "password": "placeholder",  # Will be overridden by .env
+        "ssl_mode": "require",
+        "pool_size": 20,
+        "pool_timeout": 30
+    },
+    "redis": {
+        "host": "redis.prod.internal",
+        "port": 6379,
+        "password": "placeholder",  # Will be overridden by .env
+        "db": 0,
+        "ssl": True,
+        "socket_timeout": 5
+    },
+    "security": {
+        "secret_key": "placeholder",  # Will be overridden by .env
+        "allowed_hosts": ["app.example.com", "www.example.com"],
+        "cors_origins": ["https://app.example.com"],
+        "rate_limit": 100,
+        "session_timeout": 3600
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        "file": "/var/log/myapp/app.log",
+        "max_bytes": 10485760,
+        "backup_count": 5
+    },
+    "monitoring": {
+        "enabled": True,
+        "metrics_port": 9090,
+        "health_check_interval": 30,
+        "sentry_dsn": None
     }
+}
 
-    config_path = tmpdir / "config.production.json"
-    with open(config_path, 'w') as f:
-        json.dump(config_data, f, indent=2)
+_PRODUCTION_CONFIG_JSON = _encode_json(PRODUCTION_CONFIG)
 
-    # Create .env file with secrets
-    env_path = tmpdir / ".env.production"
-    with open(env_path, 'w') as f:
-        f.write("""# Production Environment Variables
+# Example secrets file loaded alongside the production configuration
+ENV_TEMPLATE = """# Production Environment Variables
 # WARNING: Never commit this file to version control!
 
 # Database credentials
@@ -233,96 +269,122 @@ SECURITY_SECRET_KEY=abcdef1234567890abcdef1234567890abcdef1234567890
 
 # Monitoring (optional)
 # MONITORING_SENTRY_DSN=https://your-sentry-dsn@sentry.io/project
-""")
+"""
+
+
+def create_example_production_config(tmpdir: Path) -> tuple[str, str]:
+    """Create example production configuration files."""
+    # Main configuration file
+    config_path = tmpdir / "config.production.json"
+    config_path.write_bytes(_PRODUCTION_CONFIG_JSON)
+
+    # Create .env file with secrets
+    env_path = tmpdir / ".env.production"
+    env_path.write_text(ENV_TEMPLATE)
 
     return str(config_path), str(env_path)
 
 
+def _flush(out: List[str]) -> None:
+    """Write the buffered output lines with a single write call."""
+    if out:
+        sys.stdout.write('\n'.join(out) + '\n')
+        out.clear()
+
+
 def main() -> None:
     """Demonstrate production configuration setup."""
-    print("=" * 70)
-    print("Production Configuration Setup Example")
-    print("=" * 70)
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        tmpdir = Path(tmpdir)
-
-        # Create example config files
-        config_path, env_path = create_example_production_config(tmpdir)
-
-        print(f"\nCreated configuration files:")
-        print(f"  Config: {config_path}")
-        print(f"  Secrets: {env_path}")
-
-        # Load configuration
-        print("\n" + "=" * 70)
-        print("Loading Production Configuration")
-        print("=" * 70)
-
-        try:
-            config = Config(
-                config_path,
-                load_dotenv=True,
-                dotenv_path=env_path
-            )
-            print("✓ Configuration loaded successfully")
-        except Exception as e:
-            print(f"✗ Failed to load configuration: {e}")
-            sys.exit(1)
-
-        # Setup logging
-        setup_logging(config)
-        logger = logging.getLogger(__name__)
-
-        # Perform health checks
-        print("\n" + "=" * 70)
-        print("Configuration Health Checks")
-        print("=" * 70)
-
-        if check_configuration_health(config):
-            logger.info("✓ All health checks passed")
-        else:
-            logger.error("✗ Some health checks failed")
-
-        # Validate configuration
-        print("\n" + "=" * 70)
-        print("Configuration Validation")
-        print("=" * 70)
-
-        validated_config = validate_production_config(config)
-
-        if validated_config:
-            print("\n" + "=" * 70)
-            print("Configuration Summary")
-            print("=" * 70)
-            print(f"Environment:        {validated_config.environment}")
-            print(f"Debug Mode:         {validated_config.debug}")
-            print(f"Database Host:      {validated_config.database.host}")
-            print(f"Database Name:      {validated_config.database.name}")
-            print(f"Database Pool Size: {validated_config.database.pool_size}")
-            print(f"Redis Host:         {validated_config.redis.host}")
-            print(f"Redis SSL:          {validated_config.redis.ssl}")
-            print(f"Allowed Hosts:      {', '.join(validated_config.security.allowed_hosts)}")
-            print(f"Log Level:          {validated_config.logging.level}")
-            print(f"Monitoring:         {'Enabled' if validated_config.monitoring.enabled else 'Disabled'}")
-
-        print("\n" + "=" * 70)
-        print("Production Deployment Checklist")
-        print("=" * 70)
-        print("✓ Configuration files created")
-        print("✓ Secrets loaded from .env file")
-        print("✓ Configuration validated")
-        print("✓ Health checks passed")
-        print("✓ Logging configured")
-        print("\n⚠ Remember to:")
-        print("  - Never commit .env files to version control")
-        print("  - Use strong, unique passwords for all services")
-        print("  - Enable SSL/TLS for all connections")
-        print("  - Set up proper monitoring and alerting")
-        print("  - Regularly rotate secrets and credentials")
-        print("  - Review and update allowed_hosts list")
-        print("  - Configure proper backup strategies")
-        print("=" * 70)
+    # Output is collected and written in batches, flushed before anything logs
+    out: List[str] = []
+    try:
+        out.append("=" * 70)
+        out.append("Production Configuration Setup Example")
+        out.append("=" * 70)
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            tmpdir = Path(tmpdir)
+
+            # Create example config files
+            config_path, env_path = create_example_production_config(tmpdir)
+
+            out.append("\nCreated configuration files:")
+            out.append(f"  Config: {config_path}")
+            out.append(f"  Secrets: {env_path}")
+
+            # Load configuration
+            out.append("\n" + "=" * 70)
+            out.append("Loading Production Configuration")
+            out.append("=" * 70)
+
+            try:
+                config = Config(
+                    config_path,
+                    load_dotenv=True,
+                    dotenv_path=env_path
+                )
+                out.append("✓ Configuration loaded successfully")
+            except Exception as e:
+                out.append(f"✗ Failed to load configuration: {e}")
+                sys.exit(1)
+
+            # Setup logging
+            setup_logging(config)
+            logger = logging.getLogger(__name__)
+
+            # Perform health checks
+            out.append("\n" + "=" * 70)
+            out.append("Configuration Health Checks")
+            out.append("=" * 70)
+            _flush(out)
+
+            if check_configuration_health(config):
+                logger.info("✓ All health checks passed")
+            else:
+                logger.error("✗ Some health checks failed")
+
+            # Validate configuration
+            out.append("\n" + "=" * 70)
+            out.append("Configuration Validation")
+            out.append("=" * 70)
+            _flush(out)
+
+            validated_config = validate_production_config(config)
+
+            if validated_config:
+                out.append("\n" + "=" * 70)
+                out.append("Configuration Summary")
+                out.append("=" * 70)
+                out.append(f"Environment:        {validated_config.environment}")
+                out.append(f"Debug Mode:         {validated_config.debug}")
+                out.append(f"Database Host:      {validated_config.database.host}")
+                out.append(f"Database Name:      {validated_config.database.name}")
+                out.append(f"Database Pool Size: {validated_config.database.pool_size}")
+                out.append(f"Redis Host:         {validated_config.redis.host}")
+                out.append(f"Redis SSL:          {validated_config.redis.ssl}")
+                out.append(f"Allowed Hosts:      {', '.join(validated_config.security.allowed_hosts)}")
+                out.append(f"Log Level:          {validated_config.logging.level}")
+                out.append(f"Monitoring:         {'Enabled' if validated_config.monitoring.enabled else 'Disabled'}")
+
+            out.append("\n" + "=" * 70)
+            out.append("Production Deployment Checklist")
+            out.append("=" * 70)
+            out.append("✓ Configuration files created")
+            out.append("✓ Secrets loaded from .env file")
+            out.append("✓ Configuration validated")
+            out.append("✓ Health checks passed")
+            out.append("✓ Logging configured")
+            out.append("\n⚠ Remember to:")
+            out.append("  - Never commit .env files to version control")
+            out.append("  - Use strong, unique passwords for all services")
+            out.append("  - Enable SSL/TLS for all connections")
+            out.append("  - Set up proper monitoring and alerting")
+            out.append("  - Regularly rotate secrets and credentials")
+            out.append("  - Review and update allowed_hosts list")
+            out.append("  - Configure proper backup strategies")
+            out.append("=" * 70)
+    finally:
+        # Print whatever was buffered, even if setup_logging or a check raises
+        _flush(out)
 
 
 if __name__ == "__main__":
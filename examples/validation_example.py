@@ -8,10 +8,16 @@ import json
 import tempfile
 import os
 from pathlib import Path
+from typing import Any, Literal, Mapping, Type, TypeVar
+
+try:
+    import orjson  # Optional: pip install liteconfig_py[fast]
+except ImportError:
+    orjson = None
 
 # Check if validation support is available
 try:
-    from pydantic import BaseModel, Field, ValidationError
+    from pydantic import BaseModel, ConfigDict, Field, ValidationError
     from liteconfig_py import Config, ConfigValidationError
     VALIDATION_AVAILABLE = True
 except ImportError:
@@ -23,6 +29,7 @@ except ImportError:
 # Define configuration schemas using Pydantic models
 class DatabaseConfig(BaseModel):
     """Database configuration schema."""
+    model_config = ConfigDict(frozen=True)
     host: str = Field(..., description="Database hostname")
     port: int = Field(ge=1, le=65535, description="Database port")
     username: str = Field(min_length=1, description="Database username")
@@ -33,6 +40,7 @@ class DatabaseConfig(BaseModel):
 
 class ServerConfig(BaseModel):
     """Server configuration schema."""
+    model_config = ConfigDict(frozen=True)
     host: str = Field(default="0.0.0.0", description="Server bind address")
     port: int = Field(default=8080, ge=1024, le=65535)
     workers: int = Field(default=4, ge=1, le=32)
@@ -41,13 +49,15 @@ class ServerConfig(BaseModel):
 
 class LoggingConfig(BaseModel):
     """Logging configuration schema."""
-    level: str = Field(default="INFO", pattern="^(DEBUG|INFO|WARNING|ERROR|CRITICAL)$")
+    model_config = ConfigDict(frozen=True)
+    level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = Field(default="INFO")
     format: str = Field(default="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
     file: str = Field(default="/var/log/myapp.log")
 
 
 class AppConfig(BaseModel):
     """Full application configuration schema."""
+    model_config = ConfigDict(frozen=True)
     app_name: str = Field(..., min_length=1, max_length=100)
     debug: bool = Field(default=False)
     secret_key: str = Field(..., min_length=32)
@@ -56,6 +66,83 @@ class AppConfig(BaseModel):
     logging: LoggingConfig
 
 
+M = TypeVar('M', bound=BaseModel)
+
+
+def fast_build(model_cls: Type[M], data: Mapping[str, Any]) -> M:
+    """
+    Build a model from data that is already known to be valid.
+
+    Uses model_construct, recursing into nested models, so no field is
+    validated or coerced. Only use it for files this program wrote itself.
+    """
+    fields = model_cls.model_fields
+    values = {}
+    for name, value in data.items():
+        field = fields.get(name)
+        annotation = field.annotation if field is not None else None
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel) and isinstance(value, Mapping):
+            value = fast_build(annotation, value)
+        values[name] = value
+    return model_cls.model_construct(**values)
+
+
+def load_app_config(config: Config, trusted_source: bool = False) -> AppConfig:
+    """
+    Load AppConfig, skipping validation only for trusted (self-written) files.
+
+    The trusted path reads config.get_all(), which hands over the shared tree
+    without copying only when the config was loaded with frozen=True and no
+    environment override applied; other configs copy the tree once before the
+    model is built. Environment overrides are not validated on this path
+    either, so load trusted files with an env_prefix nothing else uses.
+    """
+    if trusted_source:
+        return fast_build(AppConfig, config.get_all())
+    return config.validate(AppConfig)
+
+
+def _encode_json(data: Any) -> bytes:
+    """Encode data as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode('utf-8')
+
+
+def _dump_json(data: Any, path: Path) -> None:
+    """Write data to path as indented JSON."""
+    path.write_bytes(_encode_json(data))
+
+
+# Configuration used by Example 1, serialized once at import
+VALID_CONFIG = {
+    "app_name": "My Awesome App",
+    "debug": True,
+    "secret_key": "a" * 32,  # 32 characters minimum
+    "database": {
+        "host": "localhost",
+        "port": 5432,
+        "username": "admin",
+        "password": "securepass123",
+        "database": "production_db",
+        "max_connections": 20
+    },
+    "server": {
+        "host": "0.0.0.0",
+        "port": 8080,
+        "workers": 4,
+        "timeout": 60
+    },
+    "logging": {
+        "level": "INFO",
+        "format": "%(message)s",
+        "file": "/var/log/app.log"
+    }
+}
+
+_VALID_CONFIG_JSON = _encode_json(VALID_CONFIG)
+
+
 def main() -> None:
     """Run validation examples."""
     # Create a temporary directory for our example
@@ -67,33 +154,7 @@ def main() -> None:
         print("Example 1: Valid Configuration")
         print("=" * 70)
 
-        valid_config = {
-            "app_name": "My Awesome App",
-            "debug": True,
-            "secret_key": "a" * 32,  # 32 characters minimum
-            "database": {
-                "host": "localhost",
-                "port": 5432,
-                "username": "admin",
-                "password": "securepass123",
-                "database": "production_db",
-                "max_connections": 20
-            },
-            "server": {
-                "host": "0.0.0.0",
-                "port": 8080,
-                "workers": 4,
-                "timeout": 60
-            },
-            "logging": {
-                "level": "INFO",
-                "format": "%(message)s",
-                "file": "/var/log/app.log"
-            }
-        }
-
-        with open(config_path, 'w') as f:
-            json.dump(valid_config, f, indent=2)
+        config_path.write_bytes(_VALID_CONFIG_JSON)
 
         # Load and validate
         config = Config(str(config_path))
@@ -127,12 +188,11 @@ def main() -> None:
         print("Example 3: Invalid Configuration (Port Out of Range)")
         print("=" * 70)
 
-        invalid_config = valid_config.copy()
-        invalid_config["server"]["port"] = 70000  # Invalid port
+        # Copy only the server section being changed; the rest is shared
+        invalid_config = {**VALID_CONFIG, "server": {**VALID_CONFIG["server"], "port": 70000}}  # Invalid port
 
         config_path_invalid = Path(tmpdir) / "invalid_config.json"
-        with open(config_path_invalid, 'w') as f:
-            json.dump(invalid_config, f, indent=2)
+        _dump_json(invalid_config, config_path_invalid)
 
         config_invalid = Config(str(config_path_invalid))
         try:
@@ -161,8 +221,7 @@ def main() -> None:
         }
 
         config_path_incomplete = Path(tmpdir) / "incomplete_config.json"
-        with open(config_path_incomplete, 'w') as f:
-            json.dump(incomplete_config, f, indent=2)
+        _dump_json(incomplete_config, config_path_incomplete)
 
         config_incomplete = Config(str(config_path_incomplete))
         try:
@@ -192,8 +251,7 @@ def main() -> None:
         }
 
         config_path_minimal = Path(tmpdir) / "minimal_config.json"
-        with open(config_path_minimal, 'w') as f:
-            json.dump(minimal_config, f, indent=2)
+        _dump_json(minimal_config, config_path_minimal)
 
         config_minimal = Config(str(config_path_minimal))
         try:
@@ -208,6 +266,31 @@ def main() -> None:
         except ConfigValidationError as e:
             print(f"✗ Validation failed: {e}")
 
+        # Example 6: Trusted reload without re-validation
+        print("\n" + "=" * 70)
+        print("Example 6: Trusted Reload (Skipping Validation)")
+        print("=" * 70)
+
+        # The program validates Example 5's data and writes it out itself...
+        config_path_trusted = Path(tmpdir) / "validated_config.json"
+        _dump_json(AppConfig.model_validate(minimal_config).model_dump(), config_path_trusted)
+
+        # ...so reading it back can skip validation. User-supplied files
+        # should always go through config.validate() instead. Environment
+        # overrides would bypass validation on this path too, so the file is
+        # loaded with a prefix reserved for it that nothing sets. With no
+        # overrides, the frozen config hands fast_build the parsed tree as is.
+        trusted_config = Config(
+            str(config_path_trusted),
+            env_prefix='TRUSTED_RELOAD_',
+            frozen=True
+        )
+        reloaded = load_app_config(trusted_config, trusted_source=True)
+        print("✓ Configuration rebuilt without validation!")
+        print(f"  App Name: {reloaded.app_name}")
+        print(f"  Database Name: {reloaded.database.database}")
+        print(f"  Server Port: {reloaded.server.port}")
+
         print("\n" + "=" * 70)
         print("✓ All validation examples completed!")
         print("=" * 70)
@@ -2,9 +2,304 @@
 liteconfig_py - A minimal, flexible Python configuration loader with environment variable support.
 """
 import os
-import json
-import importlib.util
-from typing import Any, Dict, Optional
+import pickle
+import functools
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
+
+# Parsed configuration trees and their flattened key index (see _flatten),
+# keyed by absolute path and stamped with the file's (mtime_ns, size), so
+# that repeated loads of an unchanged file skip the parser entirely. A
+# changed file replaces its entry, keeping one tree per path.
+_PARSE_CACHE: Dict[str, Tuple[Tuple[int, int], Any, Dict[str, Any]]] = {}
+
+# Read-only versions of cached trees for frozen instances without overrides,
+# keyed by absolute path: (source tree, frozen tree, its flattened index,
+# id of each source dict -> its proxy).
+_FROZEN_CACHE: Dict[str, Tuple[Any, Any, Dict[str, Any], Dict[int, Any]]] = {}
+
+# Mapping types a configuration tree can be built from; frozen trees use proxies.
+_MAPPING_TYPES = (dict, MappingProxyType)
+
+# Suffix of the opt-in on-disk parse cache written next to the config file.
+_DISK_CACHE_SUFFIX = '.pycache'
+
+_MISSING: Any = object()
+
+# Maps both separators of an environment variable name to a dot in one pass;
+# double underscores are first collapsed to a NUL placeholder.
+_ENV_KEY_TABLE = str.maketrans({'_': '.', '\x00': '.'})
+
+# Environment values common enough to resolve with a dict lookup instead of
+# json.loads. Only JSON spellings are listed, so 'True' stays a string.
+_FAST_COERCE: Dict[str, Any] = {'true': True, 'false': False, 'null': None, '0': 0, '1': 1}
+
+# Characters a JSON document can start with (including leading whitespace and
+# the NaN/Infinity extensions json.loads accepts); any other environment value
+# is kept as a string without attempting to parse it.
+_JSON_FIRST = frozenset('{["tfnNI-0123456789 \t\n\r')
+
+# Parser modules, imported on first use so only the formats actually loaded
+# pay their import cost.
+_JSON: Any = None
+_ORJSON: Any = None  # False once the import has been tried and failed
+_YAML: Any = None
+_TOML: Any = None
+
+
+def _get_json() -> Any:
+    """Return the json module, importing it on first use."""
+    global _JSON
+    if _JSON is None:
+        import json
+        _JSON = json
+    return _JSON
+
+
+def _get_orjson() -> Any:
+    """Return the optional orjson module, or None if it is not installed."""
+    global _ORJSON
+    if _ORJSON is None:
+        try:
+            import orjson
+        except ImportError:
+            _ORJSON = False
+        else:
+            _ORJSON = orjson
+    return _ORJSON or None
+
+
+def _get_yaml() -> Any:
+    """Return the PyYAML module, importing it on first use."""
+    global _YAML
+    if _YAML is None:
+        try:
+            import yaml
+        except ImportError:
+            raise ImportError("PyYAML is required for YAML configuration files. "
+                              "Install it with: pip install PyYAML") from None
+        _YAML = yaml
+    return _YAML
+
+
+def _get_toml() -> Any:
+    """
+    Return a TOML parser module, importing it on first use.
+
+    Prefers the stdlib tomllib (Python 3.11+), then its tomli backport, both
+    much faster than the legacy toml package tried last; each provides loads(str).
+    """
+    global _TOML
+    if _TOML is None:
+        try:
+            import tomllib as toml
+        except ImportError:
+            try:
+                import tomli as toml
+            except ImportError:
+                try:
+                    import toml
+                except ImportError:
+                    raise ImportError("tomli or toml is required for TOML configuration files "
+                                      "on Python < 3.11. Install it with: pip install tomli") from None
+        _TOML = toml
+    return _TOML
+
+
+@functools.lru_cache(maxsize=1024)
+def _split_path(key_path: str) -> Tuple[str, ...]:
+    """Split a dotted key path, memoized since paths are usually literals."""
+    return tuple(key_path.split('.'))
+
+
+@functools.lru_cache(maxsize=2048)
+def _env_to_path(env_name: str, prefix_len: int) -> Tuple[str, ...]:
+    """
+    Translate an environment variable name into configuration keys.
+
+    The first ``prefix_len`` characters (the matched prefix) are dropped and
+    both ``_`` and ``__`` separate keys. Memoized, since the same names are
+    seen by every Config created in a process. Returns () for an empty name.
+    """
+    config_path = env_name[prefix_len:].lower().replace('__', '\x00').translate(_ENV_KEY_TABLE)
+    return _split_path(config_path) if config_path else ()
+
+
+def _read_bytes(path: str) -> bytes:
+    """Read a whole file with one os.read on a raw descriptor, bypassing the io stack."""
+    fd = os.open(path, os.O_RDONLY | getattr(os, 'O_BINARY', 0))
+    try:
+        size = os.fstat(fd).st_size
+        # The first read usually returns the whole file; keep reading until EOF
+        # so short reads and files still growing are not truncated
+        data = os.read(fd, size + 1)
+        chunks = [data]
+        while data:
+            data = os.read(fd, 65536)
+            chunks.append(data)
+        return chunks[0] if len(chunks) == 2 else b''.join(chunks)
+    finally:
+        os.close(fd)
+
+
+def _fast_copy(value: Any) -> Any:
+    """Copy a parsed configuration tree, rebuilding only dicts and lists."""
+    if isinstance(value, dict):
+        return {key: _fast_copy(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_fast_copy(item) for item in value]
+    return value
+
+
+def _flatten(tree: Any, prefix: str = '', flat: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Index every value reachable through get() under its dotted key path.
+
+    Intermediate dicts are indexed too, so dict-valued lookups stay a single
+    probe. Keys that are not strings or contain a dot can't be addressed by a
+    dotted path and are left out.
+    """
+    if flat is None:
+        flat = {}
+    if isinstance(tree, _MAPPING_TYPES):
+        for key, value in tree.items():
+            if isinstance(key, str) and '.' not in key:
+                path = prefix + key
+                flat[path] = value
+                if isinstance(value, _MAPPING_TYPES):
+                    _flatten(value, path + '.', flat)
+    return flat
+
+
+def _freeze_tree(value: Any, memo: Dict[int, Any]) -> Any:
+    """
+    Wrap every dict of a tree in a read-only MappingProxyType and turn every
+    list into a tuple, so no part of a frozen tree can be changed in place.
+
+    ``memo`` maps the id of each source dict or list to its frozen version, so
+    containers frozen before (e.g. subtrees shared with the parse cache) are
+    reused.
+    """
+    if isinstance(value, dict):
+        proxy = memo.get(id(value))
+        if proxy is None:
+            proxy = MappingProxyType({key: _freeze_tree(item, memo) for key, item in value.items()})
+            memo[id(value)] = proxy
+        return proxy
+    if isinstance(value, list):
+        frozen = memo.get(id(value))
+        if frozen is None:
+            frozen = memo[id(value)] = tuple([_freeze_tree(item, memo) for item in value])
+        return frozen
+    return value
+
+
+class _Overlay:
+    """
+    Copy-on-write view over a parsed configuration tree.
+
+    ``base`` is shared with the parse cache (and every other instance loaded
+    from the same file) and is never mutated. The first write creates
+    ``writes``, a per-instance root into which only the dicts along each
+    written path are copied; untouched subtrees stay shared with ``base``.
+
+    ``flat`` maps dotted key paths to values (see _flatten) and is likewise
+    shared until the first write. Once the tree has been handed out for
+    direct mutation (materialize), ``flat`` is dropped and lookups walk the
+    tree instead.
+    """
+
+    __slots__ = ('base', 'writes', 'flat', '_owned', '_private', '_flat_owned')
+
+    def __init__(
+        self,
+        base: Any,
+        flat: Optional[Dict[str, Any]] = None,
+        private: bool = False
+    ) -> None:
+        self.base: Any = base
+        self.writes: Any = base if private else None
+        self.flat: Optional[Dict[str, Any]] = None if private else flat
+        self._owned: Set[int] = set()
+        self._private: bool = private
+        self._flat_owned: bool = False
+
+    @property
+    def root(self) -> Any:
+        """The merged tree: ``writes`` once anything was written, else ``base``."""
+        return self.base if self.writes is None else self.writes
+
+    def _owns(self, node: Dict[str, Any]) -> bool:
+        return self._private or id(node) in self._owned
+
+    def _own(self, node: Any) -> Dict[str, Any]:
+        copied = dict(node) if isinstance(node, dict) else {}
+        self._owned.add(id(copied))
+        return copied
+
+    def update(self, items: Iterable[Tuple[Tuple[str, ...], Any]]) -> None:
+        """
+        Apply several writes in order, copying shared dicts along each path.
+
+        The parent dicts resolved for one write are kept on a stack and reused
+        by the next write for as long as their key paths share a prefix, so
+        items sorted by key path only descend from the root once per section.
+        """
+        flat = self.flat
+        if flat is not None and not self._flat_owned:
+            flat = self.flat = dict(flat)
+            self._flat_owned = True
+
+        if self.writes is None or not isinstance(self.writes, dict):
+            self.writes = self._own(self.root)
+
+        # stack[i] holds the dotted path prefix and dict at depth i
+        stack: List[Tuple[str, Dict[str, Any]]] = [('', self.writes)]
+        parents: Tuple[str, ...] = ()
+
+        for keys, value in items:
+            depth = len(keys) - 1
+            shared = 0
+            limit = min(len(parents), depth)
+            while shared < limit and parents[shared] == keys[shared]:
+                shared += 1
+            del stack[shared + 1:]
+            path, current = stack[-1]
+
+            for key in keys[shared:depth]:
+                path += key
+                child = current.get(key)
+                if not isinstance(child, dict) or not self._owns(child):
+                    child = current[key] = self._own(child)
+                    if flat is not None:
+                        flat[path] = child
+                current = child
+                path += '.'
+                stack.append((path, current))
+            parents = keys[:depth]
+
+            leaf = keys[depth]
+            previous = current.get(leaf)
+            current[leaf] = value
+
+            if flat is not None:
+                path += leaf
+                if isinstance(previous, dict):
+                    for stale_path in _flatten(previous, path + '.'):
+                        flat.pop(stale_path, None)
+                flat[path] = value
+                if isinstance(value, dict):
+                    _flatten(value, path + '.', flat)
+
+    def materialize(self) -> Any:
+        """Replace the shared view with a private copy of the whole tree."""
+        if not self._private:
+            self.writes = _fast_copy(self.root)
+            self.flat = None
+            self._owned.clear()
+            self._private = True
+        return self.writes
 
 
 class Config:
@@ -16,24 +311,41 @@ class Config:
     def __init__(
         self,
         config_file: str,
-        env_prefix: Optional[str] = None,
+        env_prefix: Union[str, Sequence[str], None] = None,
         load_dotenv: bool = False,
-        dotenv_path: Optional[str] = None
+        dotenv_path: Optional[str] = None,
+        use_disk_cache: bool = False,
+        frozen: bool = False
     ) -> None:
         """
         Initialize the configuration loader.
 
         Args:
             config_file (str): Path to the configuration file (YAML, JSON, or TOML)
-            env_prefix (str, optional): Prefix for environment variables. If None,
+            env_prefix (str or sequence of str, optional): Prefix for environment
+                                       variables, or several accepted prefixes. If None,
                                        no prefix is used. Defaults to None.
             load_dotenv (bool, optional): Whether to load .env file. Defaults to False.
             dotenv_path (str, optional): Path to .env file. If None and load_dotenv is True,
                                         looks for .env in current directory. Defaults to None.
+            use_disk_cache (bool, optional): Whether to keep a pickled copy of the parsed
+                                            file in ``<config_file>.pycache`` and reuse it
+                                            while the file's mtime and size are unchanged.
+                                            Only enable it where that sidecar is as trusted
+                                            as the config file itself. Defaults to False.
+            frozen (bool, optional): Whether to make the configuration read-only once
+                                    loaded. Dicts become MappingProxyType views and lists
+                                    become tuples, set() raises TypeError, and instances
+                                    without environment overrides share one tree per file.
+                                    Defaults to False.
         """
         self.config_file: str = config_file
-        self.env_prefix: Optional[str] = env_prefix
-        self.config_data: Dict[str, Any] = {}
+        self.env_prefix: Union[str, Sequence[str], None] = env_prefix
+        self._prefixes: Tuple[str, ...] = self._normalize_prefixes(env_prefix)
+        self.use_disk_cache: bool = use_disk_cache
+        self.frozen: bool = frozen
+        # Assigned by _load_config, which either loads the file or raises
+        self._overlay: _Overlay
 
         # Load .env file if requested
         if load_dotenv:
@@ -45,6 +357,19 @@ class Config:
         # Override with environment variables
         self._apply_env_overrides()
 
+        if frozen:
+            self._freeze()
+
+    @staticmethod
+    def _normalize_prefixes(env_prefix: Union[str, Sequence[str], None]) -> Tuple[str, ...]:
+        """Return the accepted prefixes, longest first, or () for no prefix."""
+        if not env_prefix:
+            return ()
+        prefixes = [env_prefix] if isinstance(env_prefix, str) else list(env_prefix)
+        # Longest first, so overlapping prefixes strip as much as possible
+        prefixes.sort(key=len, reverse=True)
+        return tuple(prefixes)
+
     def _load_dotenv(self, dotenv_path: Optional[str] = None) -> None:
         """
         Load environment variables from a .env file.
@@ -61,29 +386,28 @@ class Config:
 
         try:
             with open(dotenv_path, 'r', encoding='utf-8') as f:
-                for line_number, line in enumerate(f, 1):
-                    # Strip whitespace
-                    line = line.strip()
-
-                    # Skip empty lines and comments
-                    if not line or line.startswith('#'):
-                        continue
-
-                    # Parse KEY=VALUE format
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-
-                        # Remove quotes if present
-                        if value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
-                        elif value.startswith("'") and value.endswith("'"):
-                            value = value[1:-1]
-
-                        # Set environment variable if not already set
-                        if key and key not in os.environ:
-                            os.environ[key] = value
+                content = f.read()
+
+            # One read, then C-level partition/strip per line; lines without
+            # '=' are skipped along with blank lines
+            for line in content.split('\n'):
+                key, sep, value = line.partition('=')
+                if not sep:
+                    continue
+
+                # Skip comments, including indented ones
+                key = key.strip()
+                if not key or key[0] == '#':
+                    continue
+
+                # Remove quotes if present
+                value = value.strip()
+                if len(value) > 1 and value[0] == value[-1] and value[0] in '"\'':
+                    value = value[1:-1]
+
+                # Set environment variable if not already set
+                if key not in os.environ:
+                    os.environ[key] = value
         except (OSError, IOError) as e:
             raise ValueError(f"Error reading .env file: {str(e)}")
         except Exception as e:
@@ -91,107 +415,188 @@ class Config:
 
     def _load_config(self) -> None:
         """Load configuration from file based on file extension."""
-        if not os.path.exists(self.config_file):
+        # The stat needed for the cache key doubles as the existence check
+        try:
+            st = os.stat(self.config_file)
+        except FileNotFoundError:
             raise FileNotFoundError(f"Configuration file not found: {self.config_file}")
 
-        file_ext = os.path.splitext(self.config_file)[1].lower()
-        
-        try:
-            if file_ext in ('.yaml', '.yml'):
-                self._load_yaml()
-            elif file_ext == '.json':
-                self._load_json()
-            elif file_ext == '.toml':
-                self._load_toml()
-            else:
-                raise ValueError(f"Unsupported configuration format: {file_ext}")
-        except Exception as e:
-            raise ValueError(f"Error loading configuration: {str(e)}")
+        cache_path = os.path.abspath(self.config_file)
+        stamp = (st.st_mtime_ns, st.st_size)
+        self._cache_path = cache_path
+        cached = _PARSE_CACHE.get(cache_path)
+        if cached is not None and cached[0] == stamp:
+            self._overlay = _Overlay(cached[1], cached[2])
+            return
 
-    def _load_yaml(self) -> None:
+        config_data = self._read_disk_cache(st) if self.use_disk_cache else _MISSING
+        if config_data is _MISSING:
+            file_ext = os.path.splitext(self.config_file)[1].lower()
+
+            try:
+                if file_ext in ('.yaml', '.yml'):
+                    config_data = self._load_yaml()
+                elif file_ext == '.json':
+                    config_data = self._load_json()
+                elif file_ext == '.toml':
+                    config_data = self._load_toml()
+                else:
+                    raise ValueError(f"Unsupported configuration format: {file_ext}")
+            except Exception as e:
+                raise ValueError(f"Error loading configuration: {str(e)}")
+
+            if self.use_disk_cache:
+                self._write_disk_cache(st, config_data)
+
+        flat = _flatten(config_data)
+        _PARSE_CACHE[cache_path] = (stamp, config_data, flat)
+        self._overlay = _Overlay(config_data, flat)
+
+    def _read_disk_cache(self, st: os.stat_result) -> Any:
+        """Return the parsed tree from the on-disk cache, or _MISSING if stale or unreadable."""
+        try:
+            with open(self.config_file + _DISK_CACHE_SUFFIX, 'rb') as f:
+                mtime_ns, size, config_data = pickle.loads(f.read())
+        except Exception:
+            return _MISSING
+        if (mtime_ns, size) != (st.st_mtime_ns, st.st_size):
+            return _MISSING
+        return config_data
+
+    def _write_disk_cache(self, st: os.stat_result, config_data: Any) -> None:
+        """Write the parsed tree to the on-disk cache; failures only cost a re-parse."""
+        cache_path = self.config_file + _DISK_CACHE_SUFFIX
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(pickle.dumps((st.st_mtime_ns, st.st_size, config_data), protocol=5))
+            os.replace(temp_path, cache_path)
+        except (OSError, pickle.PicklingError):
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+
+    @classmethod
+    def clear_parse_cache(cls) -> None:
+        """Discard all cached parse results, forcing the next load to re-read files."""
+        _PARSE_CACHE.clear()
+        _FROZEN_CACHE.clear()
+
+    def _freeze(self) -> None:
+        """Replace the tree with read-only proxies, shared across instances where possible."""
+        overlay = self._overlay
+        cached = _FROZEN_CACHE.get(self._cache_path)
+        if cached is None or cached[0] is not overlay.base:
+            # First freeze of this path, or the file changed since the last one
+            memo: Dict[int, Any] = {}
+            frozen_base = _freeze_tree(overlay.base, memo)
+            cached = (overlay.base, frozen_base, _flatten(frozen_base), memo)
+            _FROZEN_CACHE[self._cache_path] = cached
+
+        if overlay.writes is None:
+            frozen_root, flat = cached[1], cached[2]
+        else:
+            # Only the dicts copied by overrides need new proxies
+            frozen_root = _freeze_tree(overlay.writes, dict(cached[3]))
+            flat = _flatten(frozen_root)
+        self._overlay = _Overlay(frozen_root, flat)
+
+    def _load_yaml(self) -> Any:
         """Load configuration from YAML file."""
+        yaml = _get_yaml()
+        # Prefer the libyaml-backed loader when PyYAML was built with it
+        loader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
         try:
-            # Check if PyYAML is available
-            if importlib.util.find_spec("yaml") is None:
-                raise ImportError("PyYAML is required for YAML configuration files. "
-                                 "Install it with: pip install PyYAML")
-            
-            import yaml
-            with open(self.config_file, 'r') as f:
-                self.config_data = yaml.safe_load(f)
-        except ImportError as e:
-            raise e
+            return yaml.load(_read_bytes(self.config_file), Loader=loader)
         except Exception as e:
             raise ValueError(f"Failed to parse YAML file: {str(e)}")
 
-    def _load_json(self) -> None:
+    def _load_json(self) -> Any:
         """Load configuration from JSON file."""
+        json = _get_json()
+        orjson = _get_orjson()
         try:
-            with open(self.config_file, 'r') as f:
-                self.config_data = json.load(f)
+            content = _read_bytes(self.config_file)
+            if orjson is not None:
+                try:
+                    return orjson.loads(content)
+                except orjson.JSONDecodeError:
+                    # orjson rejects integers wider than 64 bits and NaN/Infinity,
+                    # which the standard library accepts; let it have the last word
+                    pass
+            return json.loads(content)
         except json.JSONDecodeError as e:
             raise ValueError(f"Failed to parse JSON file: {str(e)}")
 
-    def _load_toml(self) -> None:
+    def _load_toml(self) -> Any:
         """Load configuration from TOML file."""
+        toml = _get_toml()
         try:
-            # Check if toml is available
-            if importlib.util.find_spec("toml") is None:
-                raise ImportError("toml is required for TOML configuration files. "
-                                 "Install it with: pip install toml")
-            
-            import toml
-            with open(self.config_file, 'r') as f:
-                self.config_data = toml.load(f)
-        except ImportError as e:
-            raise e
+            return toml.loads(_read_bytes(self.config_file).decode('utf-8'))
         except Exception as e:
             raise ValueError(f"Failed to parse TOML file: {str(e)}")
 
     def _apply_env_overrides(self) -> None:
-        """Override configuration values with matching environment variables."""
-        for env_name, env_value in os.environ.items():
-            if self.env_prefix and not env_name.startswith(self.env_prefix):
-                continue
-                
-            # Remove prefix if it exists
-            if self.env_prefix:
-                config_key = env_name[len(self.env_prefix):]
-            else:
-                config_key = env_name
-                
+        """
+        Override configuration values with matching environment variables.
+
+        Overrides are applied in key path order, so a variable naming a whole
+        section (APP) is applied before variables naming keys inside it
+        (APP_PORT); variables mapping to the same key keep environment order.
+        """
+        prefixes = self._prefixes
+        env_items: Iterable[Tuple[str, int, str]]
+        if prefixes:
+            matched: List[Tuple[str, int, str]] = []
+            for env_name, env_value in os.environ.items():
+                # Prefixes are sorted longest first; the first match is stripped
+                for prefix in prefixes:
+                    if env_name.startswith(prefix):
+                        matched.append((env_name, len(prefix), env_value))
+                        break
+            if not matched:
+                # Usual case: the prefix isolates the app but no override is set
+                return
+            env_items = matched
+        else:
+            env_items = ((env_name, 0, env_value) for env_name, env_value in os.environ.items())
+
+        json = _get_json()
+
+        overrides: List[Tuple[Tuple[str, ...], Any]] = []
+        for env_name, prefix_len, env_value in env_items:
             # Convert environment variable name to configuration key path
-            # e.g., DATABASE_HOST -> database.host
-            config_path = config_key.lower().replace('__', '.').replace('_', '.')
-            
+            # e.g., DATABASE_HOST -> ('database', 'host')
+            keys = _env_to_path(env_name, prefix_len)
+
             # If the environment value exists and the configuration key exists,
             # override the value
-            if config_path:
+            if keys:
                 # Try to convert the environment value to appropriate Python type
-                try:
-                    # Try to parse as JSON first (for booleans, numbers, lists, etc.)
-                    parsed_value = json.loads(env_value)
-                except json.JSONDecodeError:
-                    # If not valid JSON, keep as string
-                    parsed_value = env_value
-                    
-                # Set the value in the config
-                self._set_nested_value(config_path, parsed_value)
+                parsed_value = _FAST_COERCE.get(env_value, _MISSING)
+                if parsed_value is _MISSING:
+                    if env_value and env_value[0] in _JSON_FIRST:
+                        try:
+                            # Try to parse as JSON (for numbers, lists, objects, etc.)
+                            parsed_value = json.loads(env_value)
+                        except json.JSONDecodeError:
+                            # If not valid JSON, keep as string
+                            parsed_value = env_value
+                    else:
+                        parsed_value = env_value
+
+                overrides.append((keys, parsed_value))
+
+        if not overrides:
+            return
+        # Sorting groups overrides by section so their writes share parent lookups
+        overrides.sort(key=itemgetter(0))
+        self._overlay.update(overrides)
 
     def _set_nested_value(self, key_path: str, value: Any) -> None:
         """Set a value in the nested configuration using dot notation."""
-        keys = key_path.split('.')
-        current = self.config_data
-        
-        # Navigate to the nested location
-        for i, key in enumerate(keys[:-1]):
-            # Create dict if it doesn't exist
-            if key not in current or not isinstance(current[key], dict):
-                current[key] = {}
-            current = current[key]
-        
-        # Set the final value
-        current[keys[-1]] = value
+        self._overlay.update(((_split_path(key_path), value),))
 
     def get(self, key_path: str, default: Any = None) -> Any:
         """
@@ -202,28 +607,52 @@ class Config:
             default: The default value to return if the key doesn't exist
 
         Returns:
-            The configuration value or the default if not found
+            The configuration value or the default if not found. Dicts and lists
+            are returned as copies, since the tree behind them is shared with
+            other instances loaded from the same file; change values through
+            set(). Frozen configurations return their read-only views instead,
+            without copying, so prefer frozen=True for read-only use.
         """
-        keys = key_path.split('.')
-        value = self.config_data
-        
-        # Navigate through the nested dictionaries
-        for key in keys:
-            if isinstance(value, dict) and key in value:
-                value = value[key]
-            else:
-                return default
-                
+        # Plain dict lookup in the flat index; this stays pure Python because
+        # a compiled walk would have nothing left to speed up.
+        flat = self._overlay.flat
+        if flat is not None:
+            value = flat.get(key_path, _MISSING)
+        else:
+            value = self._overlay.root
+
+            # Navigate through the nested dictionaries, one probe per segment
+            for key in _split_path(key_path):
+                if not isinstance(value, dict):
+                    return default
+                value = value.get(key, _MISSING)
+                if value is _MISSING:
+                    break
+
+        if value is _MISSING:
+            return default
+        if isinstance(value, (dict, list)):
+            return _fast_copy(value)
         return value
 
     def set(self, key_path: str, value: Any) -> None:
         """
         Set a configuration value using dot notation.
 
+        Dicts and lists are stored as copies, so changing the caller's object
+        afterwards does not reach the configuration or its dotted-path index.
+
         Args:
             key_path (str): The key path in dot notation, e.g., 'database.host'
             value: The value to set
+
+        Raises:
+            TypeError: If the configuration was loaded with frozen=True
         """
+        if self.frozen:
+            raise TypeError(f"Cannot set '{key_path}': configuration is frozen")
+        if isinstance(value, (dict, list)):
+            value = _fast_copy(value)
         self._set_nested_value(key_path, value)
 
     def __getitem__(self, key_path: str) -> Any:
@@ -248,10 +677,27 @@ class Config:
         """
         Get all configuration values.
 
+        The first call copies the tree shared with other instances into a
+        private dictionary, so the result can be mutated freely. Frozen
+        configurations return their read-only mapping instead.
+
         Returns:
             dict: The entire configuration dictionary
         """
-        return self.config_data
+        if self.frozen:
+            return self._overlay.root  # type: ignore[no-any-return]
+        return self._overlay.materialize()  # type: ignore[no-any-return]
+
+    @property
+    def config_data(self) -> Dict[str, Any]:
+        """The entire configuration dictionary, as returned by get_all()."""
+        return self.get_all()
+
+    @config_data.setter
+    def config_data(self, value: Dict[str, Any]) -> None:
+        if self.frozen:
+            raise TypeError("Cannot replace config_data: configuration is frozen")
+        self._overlay = _Overlay(value, private=True)
 
     def validate(self, schema: type) -> Any:
         """
@@ -281,7 +727,11 @@ class Config:
             ```
         """
         from .validation import validate_config
-        return validate_config(self.config_data, schema)
+        config_data = self._overlay.root
+        if not self.frozen:
+            # Validators may change their input; keep the shared tree out of reach
+            config_data = _fast_copy(config_data)
+        return validate_config(config_data, schema)
 
     def validate_section(self, section: str, schema: type) -> Any:
         """
@@ -312,4 +762,8 @@ class Config:
             ```
         """
         from .validation import validate_config_section
-        return validate_config_section(self.config_data, section, schema)
\ No newline at end of file
+        config_data = self._overlay.root
+        if not self.frozen and isinstance(config_data, dict) and section in config_data:
+            # Only the validated section needs a private copy
+            config_data = {section: _fast_copy(config_data[section])}
+        return validate_config_section(config_data, section, schema)
\ No newline at end of file
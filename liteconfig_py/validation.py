@@ -1,15 +1,17 @@
 """
 Schema validation support for liteconfig_py using Pydantic.
+
+Pydantic is imported on first validation rather than with the package, so
+applications that never validate do not pay its import time.
 """
-from typing import Any, Dict, Type, TypeVar, cast
+import functools
+from importlib.util import find_spec
+from typing import TYPE_CHECKING, Any, Callable, Dict, Mapping, Type, TypeVar, cast
+
+if TYPE_CHECKING:
+    from pydantic import BaseModel
 
-try:
-    from pydantic import BaseModel, ValidationError
-    PYDANTIC_AVAILABLE = True
-except ImportError:  # pragma: no cover
-    PYDANTIC_AVAILABLE = False
-    BaseModel = object  # noqa: F811
-    ValidationError = Exception  # noqa: F811
+PYDANTIC_AVAILABLE = find_spec('pydantic') is not None
 
 T = TypeVar('T', bound='BaseModel')
 
@@ -19,13 +21,29 @@ class ConfigValidationError(Exception):
     pass
 
 
+@functools.lru_cache(maxsize=128)
+def _validator(schema: type) -> Callable[[Any], Any]:
+    """
+    Return the validation callable for a schema, built once per schema.
+
+    BaseModel subclasses compile their core schema once per class, so their
+    model_validate is used directly; any other type (dataclasses, TypedDicts)
+    gets a TypeAdapter, which is costly to build and therefore cached here.
+    """
+    from pydantic import BaseModel, TypeAdapter
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_validate
+    return TypeAdapter(schema).validate_python
+
+
 def validate_config(config_data: Dict[str, Any], schema: Type[T]) -> T:
     """
     Validate configuration data against a Pydantic schema.
 
     Args:
         config_data: The configuration dictionary to validate
-        schema: A Pydantic BaseModel class defining the expected schema
+        schema: A Pydantic BaseModel class defining the expected schema, or
+            any other type Pydantic's TypeAdapter accepts (e.g. a dataclass)
 
     Returns:
         An instance of the schema with validated data
@@ -49,14 +67,16 @@ def validate_config(config_data: Dict[str, Any], schema: Type[T]) -> T:
         print(validated.port)  # Type-safe access
         ```
     """
-    if not PYDANTIC_AVAILABLE:
+    try:
+        from pydantic import ValidationError
+    except ImportError:
         raise ImportError(
             "Pydantic is required for schema validation. "
             "Install it with: pip install pydantic>=2.0"
-        )
+        ) from None
 
     try:
-        return schema(**config_data)  # type: ignore[no-any-return]
+        return cast(T, _validator(schema)(config_data))
     except ValidationError as e:
         raise ConfigValidationError(f"Configuration validation failed: {e}") from e
 
@@ -100,7 +120,7 @@ def validate_config_section(
         raise ConfigValidationError(f"Configuration section '{section}' not found")
 
     section_data = config_data[section]
-    if not isinstance(section_data, dict):
+    if not isinstance(section_data, Mapping):
         raise ConfigValidationError(
             f"Configuration section '{section}' is not a dictionary"
         )
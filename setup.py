@@ -32,15 +32,17 @@ setup(
     install_requires=[],
     extras_require={
         "yaml": ["PyYAML"],
-        "toml": ["toml"],
+        "toml": ["tomli; python_version < '3.11'"],
         "validation": ["pydantic>=2.0"],
-        "all": ["PyYAML", "toml", "pydantic>=2.0"],
+        "fast": ["orjson"],
+        "all": ["PyYAML", "tomli; python_version < '3.11'", "pydantic>=2.0", "orjson"],
         "dev": [
             "pytest>=7.0",
             "pytest-cov>=4.0",
             "PyYAML",
             "toml",
             "pydantic>=2.0",
+            "orjson",
         ],
     },
 )
\ No newline at end of file
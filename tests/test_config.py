@@ -5,19 +5,29 @@ import os
 import json
 import tempfile
 import unittest
+from unittest import mock
 from liteconfig_py import Config
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Prefixes of environment variables the tests set, mapping onto the fixture config
+_TEST_ENV_PREFIXES = ('APP_', 'DATABASE_')
+
 
 class TestConfig(unittest.TestCase):
     """Test cases for Config class."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        # Create temporary config files
-        self.temp_dir = tempfile.TemporaryDirectory()
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the temporary directory and config files shared by all tests."""
+        # Tests only read these fixtures; files a test writes get their own names
+        cls.temp_dir = tempfile.TemporaryDirectory()
 
         # Test data structure
-        self.test_config_data = {
+        cls.test_config_data = {
             "app": {
                 "debug": True,
                 "port": 8080
@@ -30,36 +40,46 @@ class TestConfig(unittest.TestCase):
         }
 
         # JSON config
-        self.json_config_path = os.path.join(self.temp_dir.name, 'config.json')
-        with open(self.json_config_path, 'w') as f:
-            json.dump(self.test_config_data, f)
+        cls.json_config_path = os.path.join(cls.temp_dir.name, 'config.json')
+        with open(cls.json_config_path, 'w') as f:
+            json.dump(cls.test_config_data, f)
 
         # YAML config
-        self.yaml_config_path = os.path.join(self.temp_dir.name, 'config.yml')
+        cls.yaml_config_path = os.path.join(cls.temp_dir.name, 'config.yml')
         try:
             import yaml
-            with open(self.yaml_config_path, 'w') as f:
-                yaml.dump(self.test_config_data, f)
+            with open(cls.yaml_config_path, 'w') as f:
+                yaml.dump(cls.test_config_data, f)
         except ImportError:
             pass  # YAML tests will be skipped if PyYAML not installed
 
         # TOML config
-        self.toml_config_path = os.path.join(self.temp_dir.name, 'config.toml')
+        cls.toml_config_path = os.path.join(cls.temp_dir.name, 'config.toml')
         try:
             import toml
-            with open(self.toml_config_path, 'w') as f:
-                toml.dump(self.test_config_data, f)
+            with open(cls.toml_config_path, 'w') as f:
+                toml.dump(cls.test_config_data, f)
         except ImportError:
             pass  # TOML tests will be skipped if toml not installed
-            
-        # Clear environment variables that might interfere with tests
-        for env_var in list(os.environ.keys()):
-            if env_var.startswith('APP_') or env_var.startswith('DATABASE_'):
-                del os.environ[env_var]
-                
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared temporary directory."""
+        cls.temp_dir.cleanup()
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        # Set aside environment variables that might interfere with tests
+        self.saved_env = {
+            key: os.environ.pop(key) for key in tuple(os.environ) if key.startswith(_TEST_ENV_PREFIXES)
+        }
+
     def tearDown(self) -> None:
         """Tear down test fixtures."""
-        self.temp_dir.cleanup()
+        # Drop variables set by the test and put back the ones set aside
+        for key in [key for key in os.environ if key.startswith(_TEST_ENV_PREFIXES)]:
+            del os.environ[key]
+        os.environ.update(self.saved_env)
         
     def test_load_json_config(self) -> None:
         """Test loading a JSON configuration file."""
@@ -535,31 +555,22 @@ class TestConfig(unittest.TestCase):
     def test_yaml_load_error_without_pyyaml(self) -> None:
         """Test error handling when trying to load YAML without PyYAML installed."""
         import sys
-        import importlib
+        from liteconfig_py import config as config_module
 
-        # Save original yaml module
+        # Save original yaml module and the loader's cached reference
         yaml_module = sys.modules.get('yaml')
+        cached_yaml = config_module._YAML
 
         try:
-            # Remove yaml from sys.modules to simulate it not being installed
-            if 'yaml' in sys.modules:
-                del sys.modules['yaml']
+            # A None entry in sys.modules makes `import yaml` raise ImportError
+            sys.modules['yaml'] = None  # type: ignore[assignment]
+            config_module._YAML = None
 
             # Create a YAML file
             yaml_path = os.path.join(self.temp_dir.name, 'test.yml')
             with open(yaml_path, 'w') as f:
                 f.write('test: value\n')
 
-            # Mock importlib.util.find_spec to return None for yaml
-            original_find_spec = importlib.util.find_spec
-
-            def mock_find_spec(name: str) -> None:
-                if name == 'yaml':
-                    return None
-                return original_find_spec(name)
-
-            importlib.util.find_spec = mock_find_spec  # type: ignore[assignment]
-
             # This should raise an ImportError
             with self.assertRaises(ValueError) as context:
                 Config(yaml_path)
@@ -567,38 +578,33 @@ class TestConfig(unittest.TestCase):
 
         finally:
             # Restore
-            importlib.util.find_spec = original_find_spec  # type: ignore[assignment]
+            config_module._YAML = cached_yaml
             if yaml_module is not None:
                 sys.modules['yaml'] = yaml_module
+            else:
+                del sys.modules['yaml']
 
     def test_toml_load_error_without_toml(self) -> None:
-        """Test error handling when trying to load TOML without toml installed."""
+        """Test error handling when trying to load TOML without any TOML parser installed."""
         import sys
-        import importlib
+        from liteconfig_py import config as config_module
 
-        # Save original toml module
-        toml_module = sys.modules.get('toml')
+        # Save the original parser modules and the loader's cached reference
+        parsers = ('tomllib', 'tomli', 'toml')
+        saved_modules = {name: sys.modules.get(name) for name in parsers}
+        cached_toml = config_module._TOML
 
         try:
-            # Remove toml from sys.modules
-            if 'toml' in sys.modules:
-                del sys.modules['toml']
+            # A None entry in sys.modules makes the import raise ImportError
+            for name in parsers:
+                sys.modules[name] = None  # type: ignore[assignment]
+            config_module._TOML = None
 
             # Create a TOML file
             toml_path = os.path.join(self.temp_dir.name, 'test.toml')
             with open(toml_path, 'w') as f:
                 f.write('[test]\nvalue = "data"\n')
 
-            # Mock importlib.util.find_spec to return None for toml
-            original_find_spec = importlib.util.find_spec
-
-            def mock_find_spec(name: str) -> None:
-                if name == 'toml':
-                    return None
-                return original_find_spec(name)
-
-            importlib.util.find_spec = mock_find_spec  # type: ignore[assignment]
-
             # This should raise an ImportError
             with self.assertRaises(ValueError) as context:
                 Config(toml_path)
@@ -606,9 +612,42 @@ class TestConfig(unittest.TestCase):
 
         finally:
             # Restore
-            importlib.util.find_spec = original_find_spec  # type: ignore[assignment]
-            if toml_module is not None:
-                sys.modules['toml'] = toml_module
+            config_module._TOML = cached_toml
+            for name, module in saved_modules.items():
+                if module is not None:
+                    sys.modules[name] = module
+                else:
+                    del sys.modules[name]
+
+    def test_toml_load_with_fallback_parser(self) -> None:
+        """Test that TOML files load with the toml package when tomllib and tomli are missing."""
+        import sys
+        try:
+            import toml  # noqa: F401
+        except ImportError:
+            self.skipTest("toml not installed")
+        from liteconfig_py import config as config_module
+
+        saved_modules = {name: sys.modules.get(name) for name in ('tomllib', 'tomli')}
+        cached_toml = config_module._TOML
+
+        try:
+            for name in saved_modules:
+                sys.modules[name] = None  # type: ignore[assignment]
+            config_module._TOML = None
+            Config.clear_parse_cache()
+
+            config = Config(self.toml_config_path)
+            self.assertIs(config_module._TOML, toml)
+            self.assertEqual(config.get('database.host'), 'localhost')
+
+        finally:
+            config_module._TOML = cached_toml
+            for name, module in saved_modules.items():
+                if module is not None:
+                    sys.modules[name] = module
+                else:
+                    del sys.modules[name]
 
     def test_malformed_yaml_file(self) -> None:
         """Test handling of malformed YAML file."""
@@ -688,6 +727,461 @@ class TestConfig(unittest.TestCase):
             except:
                 pass
 
+    def test_parse_cache_returns_independent_copies(self) -> None:
+        """Test that repeated loads of one file don't share mutable state."""
+        first = Config(self.json_config_path)
+        first.set('database.host', 'changed')
+        first.get_all()['app']['port'] = 1
+
+        second = Config(self.json_config_path)
+        self.assertEqual(second.get('database.host'), 'localhost')
+        self.assertEqual(second.get('app.port'), 8080)
+
+    def test_parse_cache_invalidated_on_change(self) -> None:
+        """Test that a modified file is re-parsed instead of served from cache."""
+        changing_path = os.path.join(self.temp_dir.name, 'changing.json')
+        with open(changing_path, 'w') as f:
+            json.dump({"value": 1}, f)
+        self.assertEqual(Config(changing_path).get('value'), 1)
+
+        with open(changing_path, 'w') as f:
+            json.dump({"value": 22}, f)
+        self.assertEqual(Config(changing_path).get('value'), 22)
+
+    def test_parse_cache_keeps_one_entry_per_file(self) -> None:
+        """Test that each new version of a file replaces its cached tree."""
+        from liteconfig_py import config as config_module
+
+        changing_path = os.path.join(self.temp_dir.name, 'versions.json')
+        for value in range(1, 4):
+            with open(changing_path, 'w') as f:
+                json.dump({"value": "x" * value}, f)
+            frozen = Config(changing_path, env_prefix='FROZEN_TEST_', frozen=True)
+            self.assertEqual(frozen.get('value'), "x" * value)
+
+        cached_paths = [path for path in config_module._PARSE_CACHE if path.endswith('versions.json')]
+        self.assertEqual(cached_paths, [os.path.abspath(changing_path)])
+        self.assertIn(os.path.abspath(changing_path), config_module._FROZEN_CACHE)
+
+    def test_clear_parse_cache(self) -> None:
+        """Test that clearing the parse cache forces a re-read."""
+        from liteconfig_py import config as config_module
+
+        Config(self.json_config_path)
+        self.assertTrue(config_module._PARSE_CACHE)
+
+        Config.clear_parse_cache()
+        self.assertFalse(config_module._PARSE_CACHE)
+        self.assertEqual(Config(self.json_config_path).get('app.port'), 8080)
+
+    def test_instances_share_untouched_subtrees(self) -> None:
+        """Test that writes copy only the written path, leaving others shared."""
+        first = Config(self.json_config_path)
+        second = Config(self.json_config_path)
+
+        first.set('app.port', 9000)
+
+        self.assertEqual(first.get('app.port'), 9000)
+        self.assertEqual(second.get('app.port'), 8080)
+        self.assertTrue(first.get('app.debug'))
+        self.assertIs(first._overlay.root['database'], second._overlay.root['database'])
+
+    def test_get_returns_copies_of_shared_containers(self) -> None:
+        """Test that mutating a value returned by get() leaks nowhere."""
+        config = Config(self.json_config_path)
+
+        config.get('app')['port'] = 1
+        self.assertEqual(config.get('app.port'), 8080)
+        self.assertEqual(config.get('app')['port'], 8080)
+
+        hosts_path = os.path.join(self.temp_dir.name, 'hosts.json')
+        with open(hosts_path, 'w') as f:
+            json.dump({"hosts": ["a", "b"]}, f)
+        Config(hosts_path).get('hosts').append("c")
+        self.assertEqual(Config(hosts_path).get('hosts'), ["a", "b"])
+
+    def test_set_copies_container_values(self) -> None:
+        """Test that mutating a dict after set() cannot leave the index stale."""
+        config = Config(self.json_config_path)
+        cache = {"ttl": 60}
+
+        config.set('cache', cache)
+        cache['ttl'] = 5
+        cache['size'] = 10
+
+        self.assertEqual(config.get('cache.ttl'), 60)
+        self.assertIsNone(config.get('cache.size'))
+        self.assertEqual(config.get('cache'), {"ttl": 60})
+
+    def test_config_data_assignment(self) -> None:
+        """Test that assigning config_data replaces the configuration."""
+        config = Config(self.json_config_path)
+        replacement = {"service": {"name": "api"}}
+
+        config.config_data = replacement
+        config.set('service.port', 80)
+
+        self.assertIs(config.config_data, replacement)
+        self.assertEqual(config.get('service.port'), 80)
+
+    def test_key_path_split_is_memoized(self) -> None:
+        """Test that repeated lookups reuse the cached key path split."""
+        from liteconfig_py.config import _split_path
+
+        config = Config(self.json_config_path)
+        config.set('database.user', 'first')
+        hits = _split_path.cache_info().hits
+        config.set('database.user', 'other')
+
+        self.assertEqual(_split_path.cache_info().hits, hits + 1)
+        self.assertEqual(config['database.user'], 'other')
+
+    def test_env_prefix_without_matches_keeps_shared_tree(self) -> None:
+        """Test that a prefix with no usable variables leaves the parsed tree untouched."""
+        config = Config(self.json_config_path, env_prefix='UNSET_TEST_')
+        self.assertIsNone(config._overlay.writes)
+
+        # A variable that is only the prefix names no key and is ignored
+        os.environ['UNSET_TEST_'] = 'value'
+        try:
+            config = Config(self.json_config_path, env_prefix='UNSET_TEST_')
+        finally:
+            del os.environ['UNSET_TEST_']
+        self.assertIsNone(config._overlay.writes)
+        self.assertEqual(config.get('app.port'), 8080)
+
+    def test_env_name_translation_is_memoized(self) -> None:
+        """Test that env var names seen before reuse their cached key translation."""
+        from liteconfig_py.config import _env_to_path
+
+        os.environ['MEMO_TEST_APP__PORT'] = '9000'
+        try:
+            Config(self.json_config_path, env_prefix='MEMO_TEST_')
+            hits = _env_to_path.cache_info().hits
+            config = Config(self.json_config_path, env_prefix='MEMO_TEST_')
+        finally:
+            del os.environ['MEMO_TEST_APP__PORT']
+
+        self.assertEqual(_env_to_path.cache_info().hits, hits + 1)
+        self.assertEqual(_env_to_path('MEMO_TEST_APP__PORT', len('MEMO_TEST_')), ('app', 'port'))
+        self.assertEqual(config.get('app.port'), 9000)
+
+    def test_env_value_type_detection(self) -> None:
+        """Test that env values are parsed as JSON only when they can be JSON."""
+        os.environ['TYPED_PATH'] = '/usr/bin:/bin'
+        os.environ['TYPED_QUOTED'] = '"quoted"'
+        os.environ['TYPED_PADDED'] = ' 42'
+        os.environ['TYPED_NULL'] = 'null'
+        os.environ['TYPED_BROKEN'] = '{not json'
+
+        try:
+            config = Config(self.json_config_path, env_prefix='TYPED_')
+        finally:
+            for key in ['TYPED_PATH', 'TYPED_QUOTED', 'TYPED_PADDED', 'TYPED_NULL', 'TYPED_BROKEN']:
+                del os.environ[key]
+
+        self.assertEqual(config.get('path'), '/usr/bin:/bin')
+        self.assertEqual(config.get('quoted'), 'quoted')
+        self.assertEqual(config.get('padded'), 42)
+        self.assertIsNone(config.get('null', 'missing'))
+        self.assertEqual(config.get('broken'), '{not json')
+
+    def test_load_json_without_orjson(self) -> None:
+        """Test that JSON loading falls back to the standard library parser."""
+        from liteconfig_py import config as config_module
+
+        cached_orjson = config_module._ORJSON
+        config_module._ORJSON = False
+        Config.clear_parse_cache()
+        try:
+            config = Config(self.json_config_path)
+            self.assertEqual(config.get('database.host'), 'localhost')
+        finally:
+            config_module._ORJSON = cached_orjson
+
+    def test_load_json_values_outside_orjson_range(self) -> None:
+        """Test that big integers and NaN/Infinity load with and without orjson."""
+        import math
+        from liteconfig_py import config as config_module
+
+        wide_path = os.path.join(self.temp_dir.name, 'wide_values.json')
+        with open(wide_path, 'w') as f:
+            f.write('{"big": 123456789012345678901234567890, "ratio": NaN, "limit": -Infinity}')
+        broken_path = os.path.join(self.temp_dir.name, 'broken_values.json')
+        with open(broken_path, 'w') as f:
+            f.write('{"big": 1,}')
+
+        parsers = [('stdlib', False)]
+        if orjson is not None:
+            parsers.append(('orjson', orjson))
+
+        cached_orjson = config_module._ORJSON
+        try:
+            for name, parser in parsers:
+                with self.subTest(parser=name):
+                    config_module._ORJSON = parser
+                    Config.clear_parse_cache()
+                    config = Config(wide_path)
+                    self.assertEqual(config.get('big'), 123456789012345678901234567890)
+                    self.assertTrue(math.isnan(config.get('ratio')))
+                    self.assertEqual(config.get('limit'), -math.inf)
+
+                    with self.assertRaises(ValueError):
+                        Config(broken_path)
+        finally:
+            config_module._ORJSON = cached_orjson
+
+    def test_disk_cache_reused_while_file_unchanged(self) -> None:
+        """Test that the on-disk cache is written and read back on the next load."""
+        import pickle
+
+        cached_path = os.path.join(self.temp_dir.name, 'disk_cached.json')
+        with open(cached_path, 'w') as f:
+            json.dump({"value": "parsed"}, f)
+
+        config = Config(cached_path, use_disk_cache=True)
+        self.assertEqual(config.get('value'), 'parsed')
+        self.assertTrue(os.path.exists(cached_path + '.pycache'))
+
+        # Replace the cached tree so a hit is distinguishable from a re-parse
+        st = os.stat(cached_path)
+        with open(cached_path + '.pycache', 'wb') as f:
+            f.write(pickle.dumps((st.st_mtime_ns, st.st_size, {"value": "cached"})))
+        Config.clear_parse_cache()
+
+        self.assertEqual(Config(cached_path, use_disk_cache=True).get('value'), 'cached')
+        self.assertEqual(Config(cached_path).get('value'), 'cached')
+        Config.clear_parse_cache()
+        self.assertEqual(Config(cached_path).get('value'), 'parsed')
+
+    def test_disk_cache_ignored_when_stale(self) -> None:
+        """Test that a sidecar for an older version of the file is not used."""
+        import pickle
+
+        stale_path = os.path.join(self.temp_dir.name, 'disk_stale.json')
+        with open(stale_path, 'w') as f:
+            json.dump({"value": "current"}, f)
+        with open(stale_path + '.pycache', 'wb') as f:
+            f.write(pickle.dumps((0, 0, {"value": "stale"})))
+
+        config = Config(stale_path, use_disk_cache=True)
+        self.assertEqual(config.get('value'), 'current')
+
+    def test_disk_cache_unusable_sidecar(self) -> None:
+        """Test that an unreadable or unwritable sidecar only costs a re-parse."""
+        blocked_path = os.path.join(self.temp_dir.name, 'disk_blocked.json')
+        with open(blocked_path, 'w') as f:
+            json.dump({"value": "parsed"}, f)
+        os.mkdir(blocked_path + '.pycache')
+
+        config = Config(blocked_path, use_disk_cache=True)
+        self.assertEqual(config.get('value'), 'parsed')
+        self.assertEqual(os.listdir(self.temp_dir.name).count('disk_blocked.json.pycache'), 1)
+        self.assertFalse([name for name in os.listdir(self.temp_dir.name) if name.endswith('.tmp')])
+
+    def test_set_replacing_subtree_drops_old_keys(self) -> None:
+        """Test that replacing a section removes keys only the old section had."""
+        config = Config(self.json_config_path)
+
+        config.set('database', {"url": "sqlite://"})
+
+        self.assertEqual(config.get('database'), {"url": "sqlite://"})
+        self.assertEqual(config.get('database.url'), 'sqlite://')
+        self.assertIsNone(config.get('database.host'))
+
+        config.set('database.pool.size', 5)
+        self.assertEqual(config.get('database'), {"url": "sqlite://", "pool": {"size": 5}})
+
+    def test_keys_containing_dots_not_addressable(self) -> None:
+        """Test that keys with dots are not reachable by a dotted path."""
+        dotted_path = os.path.join(self.temp_dir.name, 'dotted.json')
+        with open(dotted_path, 'w') as f:
+            json.dump({"a.b": 1, "a": {"b": 2}}, f)
+
+        config = Config(dotted_path, env_prefix='DOTTED_TEST_')
+        self.assertEqual(config.get('a.b'), 2)
+
+        config.get_all()
+        self.assertEqual(config.get('a.b'), 2)
+
+    def test_get_after_get_all_mutation(self) -> None:
+        """Test that direct edits to get_all() are visible through get()."""
+        config = Config(self.json_config_path)
+
+        config.get_all()['app']['port'] = 1234
+
+        self.assertEqual(config.get('app.port'), 1234)
+        self.assertEqual(config['app.port'], 1234)
+
+    def test_env_section_override_applied_before_nested_keys(self) -> None:
+        """Test that a section-wide env override doesn't discard nested ones."""
+        os.environ['ORDER_APP_PORT'] = '9000'
+        os.environ['ORDER_APP'] = '{"name": "ordered"}'
+        os.environ['ORDER_DATABASE_HOST'] = 'db.example.com'
+
+        try:
+            config = Config(self.json_config_path, env_prefix='ORDER_')
+        finally:
+            for key in ['ORDER_APP_PORT', 'ORDER_APP', 'ORDER_DATABASE_HOST']:
+                del os.environ[key]
+
+        self.assertEqual(config.get('app'), {"name": "ordered", "port": 9000})
+        self.assertIsNone(config.get('app.debug'))
+        self.assertEqual(config.get('database.host'), 'db.example.com')
+        self.assertEqual(config.get('database.user'), 'user123')
+
+    def test_dotenv_whitespace_and_inline_hashes(self) -> None:
+        """Test .env parsing of padded entries, indented comments and '#' in values."""
+        dotenv_path = os.path.join(self.temp_dir.name, 'spacing.env')
+        with open(dotenv_path, 'w') as f:
+            f.write('   # INDENTED_COMMENT=ignored\n')
+            f.write('  PADDED_KEY  =  padded value  \n')
+            f.write('HASH_VALUE=color#fff\n')
+            f.write('MISMATCHED_QUOTES="open\'\n')
+            f.write('NO_EQUALS_SIGN\n')
+            f.write('EMPTY_VALUE=\n')
+
+        keys = ['INDENTED_COMMENT', '# INDENTED_COMMENT', 'PADDED_KEY', 'HASH_VALUE',
+                'MISMATCHED_QUOTES', 'NO_EQUALS_SIGN', 'EMPTY_VALUE']
+        for key in keys:
+            os.environ.pop(key, None)
+
+        try:
+            Config(self.json_config_path, load_dotenv=True, dotenv_path=dotenv_path)
+
+            self.assertNotIn('INDENTED_COMMENT', os.environ)
+            self.assertNotIn('# INDENTED_COMMENT', os.environ)
+            self.assertNotIn('NO_EQUALS_SIGN', os.environ)
+            self.assertEqual(os.environ['PADDED_KEY'], 'padded value')
+            self.assertEqual(os.environ['HASH_VALUE'], 'color#fff')
+            self.assertEqual(os.environ['MISMATCHED_QUOTES'], '"open\'')
+            self.assertEqual(os.environ['EMPTY_VALUE'], '')
+        finally:
+            for key in keys:
+                os.environ.pop(key, None)
+
+    def test_dotenv_long_whitespace_runs(self) -> None:
+        """Test .env lines padded with long runs of whitespace parse in linear time."""
+        dotenv_path = os.path.join(self.temp_dir.name, 'long_padding.env')
+        with open(dotenv_path, 'w') as f:
+            f.write('WIDE_KEY' + ' ' * 100000 + '=x' + ' ' * 100000 + 'y\n')
+            f.write('WIDE_NO_EQUALS' + ' ' * 100000 + 'b\n')
+
+        keys = ['WIDE_KEY', 'WIDE_NO_EQUALS']
+        for key in keys:
+            os.environ.pop(key, None)
+
+        try:
+            Config(self.json_config_path, load_dotenv=True, dotenv_path=dotenv_path)
+
+            self.assertEqual(os.environ['WIDE_KEY'], 'x' + ' ' * 100000 + 'y')
+            self.assertNotIn('WIDE_NO_EQUALS', os.environ)
+        finally:
+            for key in keys:
+                os.environ.pop(key, None)
+
+    def test_multiple_env_prefixes(self) -> None:
+        """Test that any of several prefixes is accepted, longest match first."""
+        os.environ['SVC_APP_PORT'] = '9000'
+        os.environ['LEGACY_DATABASE_HOST'] = 'legacy.example.com'
+        os.environ['SVC_DB_NAME'] = 'primary'
+        os.environ['OTHER_APP_DEBUG'] = 'false'
+
+        try:
+            config = Config(self.json_config_path, env_prefix=('SVC_', 'LEGACY_', 'SVC_DB_'))
+        finally:
+            for key in ['SVC_APP_PORT', 'LEGACY_DATABASE_HOST', 'SVC_DB_NAME', 'OTHER_APP_DEBUG']:
+                del os.environ[key]
+
+        self.assertEqual(config.get('app.port'), 9000)
+        self.assertEqual(config.get('database.host'), 'legacy.example.com')
+        self.assertEqual(config.get('name'), 'primary')
+        self.assertIsNone(config.get('db.name'))
+        self.assertTrue(config.get('app.debug'))
+
+    def test_frozen_config_is_read_only(self) -> None:
+        """Test that a frozen configuration rejects modification."""
+        from types import MappingProxyType
+
+        config = Config(self.json_config_path, env_prefix='FROZEN_TEST_', frozen=True)
+
+        self.assertEqual(config.get('app.port'), 8080)
+        self.assertIsInstance(config.get('database'), MappingProxyType)
+        self.assertIsInstance(config.get_all(), MappingProxyType)
+        with self.assertRaises(TypeError):
+            config.set('app.port', 9000)
+        with self.assertRaises(TypeError):
+            config.get_all()['app'] = {}  # type: ignore[index]
+        with self.assertRaises(TypeError):
+            config.config_data = {}
+
+    def test_frozen_config_lists_are_tuples(self) -> None:
+        """Test that freezing reaches lists and the dicts inside them."""
+        from types import MappingProxyType
+
+        lists_path = os.path.join(self.temp_dir.name, 'frozen_lists.json')
+        with open(lists_path, 'w') as f:
+            json.dump({"hosts": ["a", "b"], "pools": [{"size": 1}]}, f)
+        first = Config(lists_path, env_prefix='FROZEN_TEST_', frozen=True)
+        second = Config(lists_path, env_prefix='FROZEN_TEST_', frozen=True)
+
+        self.assertEqual(first.get('hosts'), ("a", "b"))
+        self.assertIs(first.get('hosts'), second.get('hosts'))
+        self.assertIsInstance(first.get('pools')[0], MappingProxyType)
+        with self.assertRaises(AttributeError):
+            first.get('hosts').append("c")
+        with self.assertRaises(TypeError):
+            first.get('pools')[0]['size'] = 2
+
+    def test_frozen_instances_share_tree(self) -> None:
+        """Test that frozen instances without overrides share one tree."""
+        first = Config(self.json_config_path, env_prefix='FROZEN_TEST_', frozen=True)
+        second = Config(self.json_config_path, env_prefix='FROZEN_TEST_', frozen=True)
+
+        self.assertIs(first.get_all(), second.get_all())
+
+    def test_frozen_config_with_env_override(self) -> None:
+        """Test that overrides apply before freezing and untouched sections stay shared."""
+        shared = Config(self.json_config_path, env_prefix='FROZEN_TEST_', frozen=True)
+        os.environ['FROZEN_TEST_APP_PORT'] = '9000'
+        try:
+            overridden = Config(self.json_config_path, env_prefix='FROZEN_TEST_', frozen=True)
+        finally:
+            del os.environ['FROZEN_TEST_APP_PORT']
+
+        self.assertEqual(overridden.get('app.port'), 9000)
+        self.assertEqual(overridden.get('app'), {"debug": True, "port": 9000})
+        self.assertEqual(shared.get('app.port'), 8080)
+        self.assertIs(overridden.get('database'), shared.get('database'))
+        with self.assertRaises(TypeError):
+            overridden.get('app')['port'] = 1
+
+    def test_read_bytes_past_stat_size(self) -> None:
+        """Test that file reads keep going when the file is larger than its stat size."""
+        from liteconfig_py import config as config_module
+
+        path = os.path.join(self.temp_dir.name, 'large.bin')
+        payload = b'x' * 200000
+        with open(path, 'wb') as f:
+            f.write(payload)
+
+        short_stat = mock.Mock(st_size=10)
+        with mock.patch.object(config_module.os, 'fstat', return_value=short_stat):
+            self.assertEqual(config_module._read_bytes(path), payload)
+
+    def test_read_bytes_short_reads(self) -> None:
+        """Test that file reads keep going when os.read returns fewer bytes than asked."""
+        from liteconfig_py import config as config_module
+
+        path = os.path.join(self.temp_dir.name, 'short_reads.bin')
+        payload = bytes(range(256)) * 40
+        with open(path, 'wb') as f:
+            f.write(payload)
+
+        real_read = os.read
+        with mock.patch.object(config_module.os, 'read', side_effect=lambda fd, n: real_read(fd, min(n, 1000))):
+            self.assertEqual(config_module._read_bytes(path), payload)
+
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
@@ -18,23 +18,21 @@ try:
 except ImportError:
     PYDANTIC_AVAILABLE = False
 
+# Prefixes of environment variables the tests set, mapping onto the fixture config
+_TEST_ENV_PREFIXES = ('APP_', 'DATABASE_', 'MYAPP_', 'FLAG', 'ITEMS', 'PORT')
+
 
 @unittest.skipIf(not PYDANTIC_AVAILABLE, "Pydantic not installed")
 class TestValidation(unittest.TestCase):
     """Test cases for configuration validation."""
 
-    def setUp(self) -> None:
-        """Set up test fixtures."""
-        self.temp_dir = tempfile.TemporaryDirectory()
-
-        # Store original environment and clear test-related vars
-        self.original_env = os.environ.copy()
-        for key in list(os.environ.keys()):
-            if key.startswith(('APP_', 'DATABASE_', 'MYAPP_', 'FLAG', 'ITEMS', 'PORT')):
-                del os.environ[key]
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Create the temporary directory and config file shared by all tests."""
+        cls.temp_dir = tempfile.TemporaryDirectory()
 
         # Create test config
-        self.test_config_data = {
+        cls.test_config_data = {
             "app": {
                 "name": "TestApp",
                 "debug": True,
@@ -48,13 +46,24 @@ class TestValidation(unittest.TestCase):
             }
         }
 
-        self.config_path = os.path.join(self.temp_dir.name, 'config.json')
-        with open(self.config_path, 'w') as f:
-            json.dump(self.test_config_data, f)
+        cls.config_path = os.path.join(cls.temp_dir.name, 'config.json')
+        with open(cls.config_path, 'w') as f:
+            json.dump(cls.test_config_data, f)
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        """Remove the shared temporary directory."""
+        cls.temp_dir.cleanup()
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        # Store original environment and clear test-related vars
+        self.original_env = os.environ.copy()
+        for key in [key for key in os.environ if key.startswith(_TEST_ENV_PREFIXES)]:
+            del os.environ[key]
 
     def tearDown(self) -> None:
         """Tear down test fixtures."""
-        self.temp_dir.cleanup()
         # Restore original environment
         os.environ.clear()
         os.environ.update(self.original_env)
@@ -234,6 +243,73 @@ class TestValidation(unittest.TestCase):
         # Environment override should be reflected in validated config
         self.assertEqual(app_config.port, 9999)
 
+    def test_validate_frozen_config(self) -> None:
+        """Test that frozen (read-only) configurations validate like plain ones."""
+        class AppConfig(BaseModel):
+            name: str
+            port: int
+
+        class FullConfig(BaseModel):
+            app: AppConfig
+            database: dict
+
+        config = Config(self.config_path, frozen=True)
+
+        self.assertEqual(config.validate(FullConfig).app.port, 8080)
+        self.assertEqual(config.validate_section('app', AppConfig).name, "TestApp")
+
+    def test_mutating_validator_leaves_shared_tree_intact(self) -> None:
+        """Test that a before-validator changing its input can't reach other instances."""
+        from pydantic import model_validator
+
+        class AppConfig(BaseModel):
+            name: str
+            port: int
+
+            @model_validator(mode='before')
+            @classmethod
+            def fill_in(cls, data: dict) -> dict:
+                data['port'] = 99
+                data.setdefault('extra', 'filled')
+                return data
+
+        class FullConfig(BaseModel):
+            app: AppConfig
+
+            @model_validator(mode='before')
+            @classmethod
+            def drop_database(cls, data: dict) -> dict:
+                data.pop('database', None)
+                return data
+
+        config = Config(self.config_path)
+        self.assertEqual(config.validate_section('app', AppConfig).port, 99)
+        self.assertEqual(config.validate(FullConfig).app.port, 99)
+
+        for fresh in (config, Config(self.config_path)):
+            self.assertEqual(fresh.get('app'), {"name": "TestApp", "debug": True, "port": 8080})
+            self.assertEqual(fresh.get('app.port'), 8080)
+            self.assertEqual(fresh.get('database.host'), 'localhost')
+
+    def test_validate_section_with_dataclass(self) -> None:
+        """Test validating against a dataclass, whose validator is built once."""
+        from dataclasses import dataclass
+        from liteconfig_py.validation import _validator
+
+        @dataclass
+        class DatabaseSettings:
+            host: str
+            port: int
+
+        config = Config(self.config_path)
+        first = config.validate_section('database', DatabaseSettings)
+        hits = _validator.cache_info().hits
+        second = config.validate_section('database', DatabaseSettings)
+
+        self.assertEqual(first, DatabaseSettings(host="localhost", port=5432))
+        self.assertEqual(second, first)
+        self.assertEqual(_validator.cache_info().hits, hits + 1)
+
     def test_standalone_validate_config(self) -> None:
         """Test using validate_config function directly."""
         class SimpleConfig(BaseModel):
@@ -257,12 +333,26 @@ class TestValidation(unittest.TestCase):
         self.assertEqual(validated.field, "value")
 
 
-# Note: Tests for PYDANTIC_AVAILABLE=False path are not included because:
-# 1. In CI, Pydantic is always installed (in dev dependencies)
-# 2. The ImportError fallback paths are excluded from coverage requirements
-# 3. Manual testing can verify the library works without Pydantic installed
-# The fallback behavior is simple: PYDANTIC_AVAILABLE=False and validate_config
-# raises ImportError with a helpful message. This is covered by coverage exclusions.
+class TestValidationWithoutPydantic(unittest.TestCase):
+    """Test cases for validation when Pydantic cannot be imported."""
+
+    def test_validate_config_requires_pydantic(self) -> None:
+        """Test that validating without Pydantic raises a helpful ImportError."""
+        import sys
+        from liteconfig_py.validation import validate_config
+
+        # A None entry in sys.modules makes `import pydantic` raise ImportError
+        pydantic_module = sys.modules.get('pydantic')
+        sys.modules['pydantic'] = None  # type: ignore[assignment]
+        try:
+            with self.assertRaises(ImportError) as context:
+                validate_config({"field": "value"}, object)  # type: ignore[type-var]
+            self.assertIn('Pydantic is required', str(context.exception))
+        finally:
+            if pydantic_module is not None:
+                sys.modules['pydantic'] = pydantic_module
+            else:
+                del sys.modules['pydantic']
 
 
 if __name__ == '__main__':